@@ -16,44 +16,34 @@ import sys
 from pathlib import Path
 
 
-PACKAGE_HEADER_RE = re.compile(r"^\[package\]\s*$")
-SECTION_HEADER_RE = re.compile(r"^\[[^\]]+\]\s*$")
-VERSION_LINE_RE = re.compile(r"^(?P<indent>\s*)version\s*=\s*\"(?P<ver>[^\"]+)\"\s*$")
+# Matches the first `version = "..."` line inside the top-level [package] section.
+# The tempered `(?!^[ \t]*\[)` token stops the scan at the next section header.
+PKG_VERSION_RE = re.compile(
+    r"(?m)^[ \t]*\[package\][ \t]*$\n"
+    r"(?:(?!^[ \t]*\[)[\s\S])*?"
+    r"^[ \t]*version\s*=\s*\"(?P<ver>[^\"]+)\"[ \t]*$"
+)
+
+# Basic sanity: semver-ish (allow prerelease/build metadata)
+# Examples: 1.2.3, 1.2.3-rc.1, 1.2.3+build.7, 1.2.3-rc.1+build.7
+SEMVER_RE = re.compile(r"^[0-9]+\.[0-9]+\.[0-9]+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?$")
 
 
 def bump_version(cargo_toml_path: Path, new_version: str) -> bool:
-    text = cargo_toml_path.read_text(encoding="utf-8").splitlines(keepends=True)
-
-    in_package = False
-    changed = False
-
-    for i, line in enumerate(text):
-        if PACKAGE_HEADER_RE.match(line.strip()):
-            in_package = True
-            continue
-
-        if in_package and SECTION_HEADER_RE.match(line.strip()):
-            # End of [package] section
-            break
-
-        if in_package:
-            m = VERSION_LINE_RE.match(line)
-            if m:
-                indent = m.group("indent")
-                old_version = m.group("ver")
-                if old_version == new_version:
-                    return False
-                text[i] = f'{indent}version = "{new_version}"\n'
-                changed = True
-                break
-
-    if not changed:
+    text = cargo_toml_path.read_text(encoding="utf-8")
+
+    m = PKG_VERSION_RE.search(text)
+    if m is None:
         raise RuntimeError(
             f"Could not find [package].version in {cargo_toml_path}. "
             "Expected a line like: version = \"x.y.z\" within the [package] section."
         )
 
-    cargo_toml_path.write_text("".join(text), encoding="utf-8")
+    if m.group("ver") == new_version:
+        return False
+
+    text = text[: m.start("ver")] + new_version + text[m.end("ver") :]
+    cargo_toml_path.write_text(text, encoding="utf-8")
     return True
 
 
@@ -68,9 +58,7 @@ def main() -> int:
         print(f"error: file not found: {cargo_path}", file=sys.stderr)
         return 2
 
-    # Basic sanity: semver-ish (allow prerelease/build metadata)
-    # Examples: 1.2.3, 1.2.3-rc.1, 1.2.3+build.7, 1.2.3-rc.1+build.7
-    if not re.match(r"^[0-9]+\.[0-9]+\.[0-9]+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?$", args.version):
+    if not SEMVER_RE.match(args.version):
         print(f"error: invalid version format: {args.version}", file=sys.stderr)
         return 2
 